@@ -29,6 +29,12 @@ from pxr import Ar
 import unittest
 import shutil
 
+# Force Ar to use the default resolver implementation. This must happen
+# before the first call to Ar.GetResolver(); doing it at module load
+# ensures it runs exactly once even if the test class is set up multiple
+# times by the runner.
+Ar.SetPreferredResolver('ArDefaultResolver')
+
 class TestArDefaultResolver(unittest.TestCase):
     def assertPathsEqual(self, path1, path2):
         # Flip backslashes to forward slashes to accommodate platform
@@ -38,9 +44,6 @@ class TestArDefaultResolver(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        # Force Ar to use the default resolver implementation.
-        Ar.SetPreferredResolver('ArDefaultResolver')
-
         # Set up default search path for test_ResolveSearchPaths below. This
         # must be done before any calls to Ar.GetResolver()
         Ar.DefaultResolver.SetDefaultSearchPath([
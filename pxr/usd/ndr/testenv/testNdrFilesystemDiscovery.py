@@ -34,6 +34,13 @@ os.environ["PXR_NDR_FS_PLUGIN_ALLOWED_EXTS"] = "oso:args"
 
 from pxr.Ndr import _FilesystemDiscoveryPlugin
 
+# Node names the discovery process is expected to find, built once at
+# module load rather than on every run of the test method.
+_EXPECTED_NODE_NAMES = frozenset({
+    "TestNodeARGS", "TestNodeOSL", "NestedTestARGS",
+    "NestedTestOSL", "TestNodeSameName"
+})
+
 class TestNdrFilesystemDiscovery(unittest.TestCase):
     def test_NdrFilesystemDiscovery(self):
         """
@@ -44,13 +51,11 @@ class TestNdrFilesystemDiscovery(unittest.TestCase):
         fsPlugin = _FilesystemDiscoveryPlugin()
         context = _FilesystemDiscoveryPlugin.Context()
         discoveryResults = fsPlugin.DiscoverNodes(context)
-        discoveredNodeNames = [result.name for result in discoveryResults]
 
-        assert len(discoveryResults) == 6
-        assert set(discoveredNodeNames) == {
-            "TestNodeARGS", "TestNodeOSL", "NestedTestARGS", "NestedTestOSL",
-            "TestNodeSameName"
-        }
+        self.assertEqual(len(discoveryResults), 6)
+        self.assertSetEqual(
+            set(result.name for result in discoveryResults),
+            _EXPECTED_NODE_NAMES)
 
 if __name__ == '__main__':
     unittest.main()
@@ -25,13 +25,118 @@
 from pxr import Sdf, Tf, Pcp
 import unittest, sys
 
+# Relationship target path expectations for the testCsdLayering8-derived
+# tests below, keyed by property path. The Sdf.Path objects are built once
+# at module load instead of being re-parsed on every test iteration.
+def _BuildPathMap(pathMap):
+    return dict((Sdf.Path(k), Sdf.Path(v)) for (k, v) in pathMap.items())
+
+_LOCAL_ABS_PATH_MAP = _BuildPathMap({"/World/Chars/Ref1.localSelfAbs" : "/World/Chars/Ref1",
+                                    "/World/Chars/Ref1.localParentAbs" : "/World/Chars",
+                                    "/World/Chars/Ref1.localChildAbs" : "/World/Chars/Ref1/RefChild",
+                                    "/World/Chars/Ref1/RefChild.localSelfAbs" : "/World/Chars/Ref1/RefChild",
+                                    "/World/Chars/Ref1/RefChild.localParentAbs" : "/World/Chars/Ref1",
+
+                                    "/World/Chars/Ref2.localSelfAbs" : "/World/Chars/Ref2",
+                                    "/World/Chars/Ref2.localParentAbs" : "/World/Chars",
+                                    "/World/Chars/Ref2.localChildAbs" : "/World/Chars/Ref2/RefChild",
+                                    "/World/Chars/Ref2/RefChild.localSelfAbs" : "/World/Chars/Ref2/RefChild",
+                                    "/World/Chars/Ref2/RefChild.localParentAbs" : "/World/Chars/Ref2",
+
+                                    "/World/Ref3.localSelfAbs" : "/World/Ref3",
+                                    "/World/Ref3.localParentAbs" : "/World",
+                                    "/World/Ref3.localChildAbs" : "/World/Ref3/RefChild",
+                                    "/World/Ref3/RefChild.localSelfAbs" : "/World/Ref3/RefChild",
+                                    "/World/Ref3/RefChild.localParentAbs" : "/World/Ref3"})
+
+_LOCAL_REL_PATH_MAP = _BuildPathMap({"/World/Chars/Ref1.localSelfRel" : ".",
+                                    "/World/Chars/Ref1.localParentRel" : "..",
+                                    "/World/Chars/Ref1.localChildRel" : "RefChild",
+                                    "/World/Chars/Ref1/RefChild.localSelfRel" : ".",
+                                    "/World/Chars/Ref1/RefChild.localParentRel" : "..",
+
+                                    "/World/Chars/Ref2.localSelfRel" : ".",
+                                    "/World/Chars/Ref2.localParentRel" : "..",
+                                    "/World/Chars/Ref2.localChildRel" : "RefChild",
+                                    "/World/Chars/Ref2/RefChild.localSelfRel" : ".",
+                                    "/World/Chars/Ref2/RefChild.localParentRel" : "..",
+                                    
+                                    "/World/Ref3.localSelfRel" : ".",
+                                    "/World/Ref3.localParentRel" : "..",
+                                    "/World/Ref3.localChildRel" : "RefChild",
+                                    "/World/Ref3/RefChild.localSelfRel" : ".",
+                                    "/World/Ref3/RefChild.localParentRel" : ".."})
+
+_REF_ABS_PATH_MAP = _BuildPathMap({"/World/Chars/Ref1.refSelfAbs" : "/World/Chars/Ref1",
+                                  "/World/Chars/Ref1.refChildAbs" : "/World/Chars/Ref1/RefChild",
+                                  "/World/Chars/Ref1/RefChild.refSelfAbs" : "/World/Chars/Ref1/RefChild",
+                                  "/World/Chars/Ref1/RefChild.refParentAbs" : "/World/Chars/Ref1",
+
+                                  "/World/Chars/Ref2.refSelfAbs" : "/World/Chars/Ref2",
+                                  "/World/Chars/Ref2.refChildAbs" : "/World/Chars/Ref2/RefChild",
+                                  "/World/Chars/Ref2/RefChild.refSelfAbs" : "/World/Chars/Ref2/RefChild",
+                                  "/World/Chars/Ref2/RefChild.refParentAbs" : "/World/Chars/Ref2",
+
+                                  "/World/Ref3.refSelfAbs" : "/World/Ref3",
+                                  "/World/Ref3.refChildAbs" : "/World/Ref3/RefChild",
+                                  "/World/Ref3/RefChild.refSelfAbs" : "/World/Ref3/RefChild",
+                                  "/World/Ref3/RefChild.refParentAbs" : "/World/Ref3"})
+
+_REF_REL_PATH_MAP = _BuildPathMap({"/World/Chars/Ref1.refSelfRel" : ".",
+                                  "/World/Chars/Ref1.refChildRel" : "RefChild",
+                                  "/World/Chars/Ref1/RefChild.refSelfRel" : ".",
+                                  "/World/Chars/Ref1/RefChild.refParentRel" : "..",
+
+                                  "/World/Chars/Ref2.refSelfRel" : ".",
+                                  "/World/Chars/Ref2.refChildRel" : "RefChild",
+                                  "/World/Chars/Ref2/RefChild.refSelfRel" : ".",
+                                  "/World/Chars/Ref2/RefChild.refParentRel" : "..",
+
+                                  "/World/Ref3.refSelfRel" : ".",
+                                  "/World/Ref3.refChildRel" : "RefChild",
+                                  "/World/Ref3/RefChild.refSelfRel" : ".",
+                                  "/World/Ref3/RefChild.refParentRel" : ".."})
+
+_REF_ERROR_PATHS = [Sdf.Path(p) for p in
+                    ["/World/Chars/Ref1.refBadAbs",
+                     "/World/Chars/Ref1.refBadRel",
+                     "/World/Chars/Ref1/RefChild.refBadAbs",
+                     "/World/Chars/Ref1/RefChild.refBadRel",
+
+                     "/World/Chars/Ref2.refBadAbs",
+                     "/World/Chars/Ref2.refBadRel",
+                     "/World/Chars/Ref2/RefChild.refBadAbs",
+                     "/World/Chars/Ref2/RefChild.refBadRel",
+
+                     "/World/Ref3.refBadAbs",
+                     "/World/Ref3.refBadRel",
+                     "/World/Ref3/RefChild.refBadAbs",
+                     "/World/Ref3/RefChild.refBadRel"]]
+
 class TestPcpPathTranslation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # All of the target path tests below compose the same root layer,
+        # so open it and build the corresponding Pcp.Cache once for the
+        # whole class instead of re-parsing the layer per test.
+        rootLayer = Sdf.Layer.FindOrOpen("Root.sdf")
+        assert rootLayer, "Cannot open layer Root.sdf"
+        cls._rootCache = Pcp.Cache(Pcp.LayerStackIdentifier(rootLayer))
+
     def _GetPcpCacheForLayer(self, rootLayerPath):
         rootLayer = Sdf.Layer.FindOrOpen(rootLayerPath)
         self.assertTrue(rootLayer, "Cannot open layer %s" % (rootLayerPath))
 
         return Pcp.Cache(Pcp.LayerStackIdentifier(rootLayer))
 
+    def _WarmPrimIndexes(self, pcpCache, propPaths):
+        # Compute the prim index for each prim the given property paths
+        # belong to up front, so the per-property target path computations
+        # below reuse cached composition results instead of recomposing
+        # the same prims over and over.
+        for primPath in set(p.GetPrimPath() for p in propPaths):
+            pcpCache.ComputePrimIndex(primPath)
+
     ############################################################
 
     def test_PathTranslationWithVariants(self):
@@ -61,171 +166,111 @@ class TestPcpPathTranslation(unittest.TestCase):
     def test_LocalAbsoluteTargetPaths(self):
         print "TestLocalAbsoluteTargetPaths..."
 
-        pcpCache = self._GetPcpCacheForLayer("Root.sdf")
+        pcpCache = self._rootCache
 
         errors = []
-        pathMap = {"/World/Chars/Ref1.localSelfAbs" : "/World/Chars/Ref1",
-                   "/World/Chars/Ref1.localParentAbs" : "/World/Chars",
-                   "/World/Chars/Ref1.localChildAbs" : "/World/Chars/Ref1/RefChild",
-                   "/World/Chars/Ref1/RefChild.localSelfAbs" : "/World/Chars/Ref1/RefChild",
-                   "/World/Chars/Ref1/RefChild.localParentAbs" : "/World/Chars/Ref1",
-
-                   "/World/Chars/Ref2.localSelfAbs" : "/World/Chars/Ref2",
-                   "/World/Chars/Ref2.localParentAbs" : "/World/Chars",
-                   "/World/Chars/Ref2.localChildAbs" : "/World/Chars/Ref2/RefChild",
-                   "/World/Chars/Ref2/RefChild.localSelfAbs" : "/World/Chars/Ref2/RefChild",
-                   "/World/Chars/Ref2/RefChild.localParentAbs" : "/World/Chars/Ref2",
-
-                   "/World/Ref3.localSelfAbs" : "/World/Ref3",
-                   "/World/Ref3.localParentAbs" : "/World",
-                   "/World/Ref3.localChildAbs" : "/World/Ref3/RefChild",
-                   "/World/Ref3/RefChild.localSelfAbs" : "/World/Ref3/RefChild",
-                   "/World/Ref3/RefChild.localParentAbs" : "/World/Ref3"}
+        pathMap = _LOCAL_ABS_PATH_MAP
+
+        self._WarmPrimIndexes(pcpCache, pathMap)
 
         for (path, expectedTargetPath) in pathMap.items():
             (curTargetPaths, curErrors) = \
                 pcpCache.ComputeRelationshipTargetPaths(path)
 
-            for err in curErrors:
-                print >> sys.stderr, err
+            if curErrors:
+                sys.stderr.write('\n'.join(map(str, curErrors)) + '\n')
             errors += curErrors
 
-            self.assertEqual(curTargetPaths, [Sdf.Path(expectedTargetPath)])
+            self.assertEqual(curTargetPaths, [expectedTargetPath])
 
         self.assertEqual(len(errors), 0)
 
     def test_LocalRelativeTargetPaths(self):
         print "TestLocalRelativeTargetPaths..."
 
-        pcpCache = self._GetPcpCacheForLayer("Root.sdf")
+        pcpCache = self._rootCache
 
         errors = []
-        pathMap = {"/World/Chars/Ref1.localSelfRel" : ".",
-                   "/World/Chars/Ref1.localParentRel" : "..",
-                   "/World/Chars/Ref1.localChildRel" : "RefChild",
-                   "/World/Chars/Ref1/RefChild.localSelfRel" : ".",
-                   "/World/Chars/Ref1/RefChild.localParentRel" : "..",
-
-                   "/World/Chars/Ref2.localSelfRel" : ".",
-                   "/World/Chars/Ref2.localParentRel" : "..",
-                   "/World/Chars/Ref2.localChildRel" : "RefChild",
-                   "/World/Chars/Ref2/RefChild.localSelfRel" : ".",
-                   "/World/Chars/Ref2/RefChild.localParentRel" : "..",
-                   
-                   "/World/Ref3.localSelfRel" : ".",
-                   "/World/Ref3.localParentRel" : "..",
-                   "/World/Ref3.localChildRel" : "RefChild",
-                   "/World/Ref3/RefChild.localSelfRel" : ".",
-                   "/World/Ref3/RefChild.localParentRel" : ".."}
+        pathMap = _LOCAL_REL_PATH_MAP
+
+        self._WarmPrimIndexes(pcpCache, pathMap)
 
         for (path, expectedTargetPath) in pathMap.items():
-            relPath = Sdf.Path(path)
+            relPath = path
             (curTargetPaths, curErrors) = pcpCache.ComputeRelationshipTargetPaths(relPath)
 
-            for err in curErrors:
-                print >> sys.stderr, err
+            if curErrors:
+                sys.stderr.write('\n'.join(map(str, curErrors)) + '\n')
             errors += curErrors
 
             self.assertEqual(curTargetPaths, 
-                        [Sdf.Path(expectedTargetPath).MakeAbsolutePath(relPath.GetPrimPath())])
+                        [expectedTargetPath.MakeAbsolutePath(relPath.GetPrimPath())])
 
         self.assertEqual(len(errors), 0)
         
     def test_ReferenceAbsoluteTargetPaths(self):
         print "TestReferenceAbsoluteTargetPaths..."
 
-        pcpCache = self._GetPcpCacheForLayer("Root.sdf")
+        pcpCache = self._rootCache
 
         errors = []
-        pathMap = {"/World/Chars/Ref1.refSelfAbs" : "/World/Chars/Ref1",
-                   "/World/Chars/Ref1.refChildAbs" : "/World/Chars/Ref1/RefChild",
-                   "/World/Chars/Ref1/RefChild.refSelfAbs" : "/World/Chars/Ref1/RefChild",
-                   "/World/Chars/Ref1/RefChild.refParentAbs" : "/World/Chars/Ref1",
-
-                   "/World/Chars/Ref2.refSelfAbs" : "/World/Chars/Ref2",
-                   "/World/Chars/Ref2.refChildAbs" : "/World/Chars/Ref2/RefChild",
-                   "/World/Chars/Ref2/RefChild.refSelfAbs" : "/World/Chars/Ref2/RefChild",
-                   "/World/Chars/Ref2/RefChild.refParentAbs" : "/World/Chars/Ref2",
+        pathMap = _REF_ABS_PATH_MAP
 
-                   "/World/Ref3.refSelfAbs" : "/World/Ref3",
-                   "/World/Ref3.refChildAbs" : "/World/Ref3/RefChild",
-                   "/World/Ref3/RefChild.refSelfAbs" : "/World/Ref3/RefChild",
-                   "/World/Ref3/RefChild.refParentAbs" : "/World/Ref3"}
+        self._WarmPrimIndexes(pcpCache, pathMap)
 
         for (path, expectedTargetPath) in pathMap.items():
             (curTargetPaths, curErrors) = \
                 pcpCache.ComputeRelationshipTargetPaths(path)
 
-            for err in curErrors:
-                print >> sys.stderr, err
+            if curErrors:
+                sys.stderr.write('\n'.join(map(str, curErrors)) + '\n')
             errors += curErrors
 
-            self.assertEqual(curTargetPaths, [Sdf.Path(expectedTargetPath)])
+            self.assertEqual(curTargetPaths, [expectedTargetPath])
 
         self.assertEqual(len(errors), 0)
 
     def test_ReferenceRelativeTargetPaths(self):
         print "TestReferenceRelativeTargetPaths..."
 
-        pcpCache = self._GetPcpCacheForLayer("Root.sdf")
+        pcpCache = self._rootCache
 
         errors = []
-        pathMap = {"/World/Chars/Ref1.refSelfRel" : ".",
-                   "/World/Chars/Ref1.refChildRel" : "RefChild",
-                   "/World/Chars/Ref1/RefChild.refSelfRel" : ".",
-                   "/World/Chars/Ref1/RefChild.refParentRel" : "..",
+        pathMap = _REF_REL_PATH_MAP
 
-                   "/World/Chars/Ref2.refSelfRel" : ".",
-                   "/World/Chars/Ref2.refChildRel" : "RefChild",
-                   "/World/Chars/Ref2/RefChild.refSelfRel" : ".",
-                   "/World/Chars/Ref2/RefChild.refParentRel" : "..",
-
-                   "/World/Ref3.refSelfRel" : ".",
-                   "/World/Ref3.refChildRel" : "RefChild",
-                   "/World/Ref3/RefChild.refSelfRel" : ".",
-                   "/World/Ref3/RefChild.refParentRel" : ".."}
+        self._WarmPrimIndexes(pcpCache, pathMap)
 
         for (path, expectedTargetPath) in pathMap.items():
-            relPath = Sdf.Path(path)
+            relPath = path
             (curTargetPaths, curErrors) = pcpCache.ComputeRelationshipTargetPaths(relPath)
 
-            for err in curErrors:
-                print >> sys.stderr, err
+            if curErrors:
+                sys.stderr.write('\n'.join(map(str, curErrors)) + '\n')
             errors += curErrors
 
             self.assertEqual(curTargetPaths, 
-                        [Sdf.Path(expectedTargetPath).MakeAbsolutePath(relPath.GetPrimPath())])
+                        [expectedTargetPath.MakeAbsolutePath(relPath.GetPrimPath())])
             
         self.assertEqual(len(errors), 0)
 
     def test_ReferenceErrorCases(self):
         print "TestReferenceErrorCases..."
 
-        pcpCache = self._GetPcpCacheForLayer("Root.sdf")
+        pcpCache = self._rootCache
 
         errors = []
-        paths = ["/World/Chars/Ref1.refBadAbs",
-                 "/World/Chars/Ref1.refBadRel",
-                 "/World/Chars/Ref1/RefChild.refBadAbs",
-                 "/World/Chars/Ref1/RefChild.refBadRel",
-
-                 "/World/Chars/Ref2.refBadAbs",
-                 "/World/Chars/Ref2.refBadRel",
-                 "/World/Chars/Ref2/RefChild.refBadAbs",
-                 "/World/Chars/Ref2/RefChild.refBadRel",
-
-                 "/World/Ref3.refBadAbs",
-                 "/World/Ref3.refBadRel",
-                 "/World/Ref3/RefChild.refBadAbs",
-                 "/World/Ref3/RefChild.refBadRel"]
+        paths = _REF_ERROR_PATHS
         
+        self._WarmPrimIndexes(pcpCache, paths)
+
         for path in paths:
             (targetPaths, curErrors) = \
                 pcpCache.ComputeRelationshipTargetPaths(path)
             errors += curErrors
 
+        if errors:
+            sys.stderr.write('\n'.join(map(str, errors)) + '\n')
         for err in errors:
-            print >> sys.stderr, err
             self.assertTrue(isinstance(err, Pcp.ErrorInvalidExternalTargetPath), 
                    "Unexpected Error: %s" % err)
 